@@ -2,6 +2,22 @@
 import json
 from pathlib import Path
 
+# Prefer orjson (C-accelerated) for JSON I/O, falling back to the stdlib.
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent=4):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj, indent=4):
+        return json.dumps(obj, indent=indent).encode()
+
 CONFIG_DIR = Path("/etc/docker-janitor")
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
@@ -16,35 +32,49 @@ DEFAULT_CONFIG = {
     "backup_file": "/var/lib/docker-janitor/backup.json"
 }
 
+# In-process cache keyed by the config file's mtime so repeated load_config()
+# calls don't re-open and re-parse the file. The common case is one os.stat.
+_CACHE = {"mtime": None, "cfg": None}
+
 def load_config() -> dict:
     """Loads the configuration from the JSON file."""
     if not CONFIG_FILE.exists():
-        save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        config = dict(DEFAULT_CONFIG)
+        save_config(config)
+        return config
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-            # Ensure all keys are present and force update critical settings for debugging
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+        if mtime == _CACHE["mtime"] and _CACHE["cfg"] is not None:
+            return _CACHE["cfg"]
+        with open(CONFIG_FILE, "rb") as f:
+            config = json_loads(f.read())
+            # Ensure all keys are present
+            changed = False
             for key, value in DEFAULT_CONFIG.items():
                 if key not in config:
                     config[key] = value
-                # Force update these settings for debugging
-                if key in ["image_age_threshold_days", "log_level"]:
-                    config[key] = value
-            # Save the updated config back
-            save_config(config)
+                    changed = True
+            # Only rewrite the file when keys were actually added
+            if changed:
+                save_config(config)
+            else:
+                _CACHE["mtime"] = mtime
+                _CACHE["cfg"] = config
             return config
-    except (json.JSONDecodeError, IOError):
+    except (ValueError, IOError):
         # If file is corrupted or unreadable, save default and return it
-        save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        config = dict(DEFAULT_CONFIG)
+        save_config(config)
+        return config
 
 def save_config(config: dict):
     """Saves the configuration to the JSON file."""
     try:
         CONFIG_DIR.mkdir(exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
+        with open(CONFIG_FILE, "wb") as f:
+            f.write(json_dumps(config))
+        _CACHE["mtime"] = CONFIG_FILE.stat().st_mtime_ns
+        _CACHE["cfg"] = config
     except IOError:
         # This might happen due to permissions issues, though install script should handle it.
         # In a real app, we'd log this error.
@@ -59,3 +89,9 @@ def set_config_value(key: str, value):
     config = load_config()
     config[key] = value
     save_config(config)
+
+def set_config_values(values: dict):
+    """Sets several values in the config with a single write."""
+    config = load_config()
+    config.update(values)
+    save_config(config)
@@ -1,11 +1,13 @@
 
 import time
-import docker
 from datetime import datetime, timedelta, timezone
 import logging
 import os
-import json
 import fnmatch
+import re
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Try relative imports first, fall back to absolute imports
@@ -79,148 +81,195 @@ def setup_logging():
     
     return logging.getLogger(__name__)
 
-# Initialize logger
-logger = setup_logging()
+# Module logger; handlers are attached lazily so importing this module doesn't
+# trigger config I/O just to set up logging.
+logger = logging.getLogger(__name__)
 
-def should_exclude_image(image, exclusion_patterns):
-    """Check if an image should be excluded based on patterns."""
-    if not exclusion_patterns:
+_logging_configured = False
+
+def _ensure_logging():
+    """Run setup_logging() once, on first actual use of the daemon."""
+    global _logging_configured
+    if not _logging_configured:
+        setup_logging()
+        _logging_configured = True
+
+def image_short_id(image):
+    """Short identifier (sha256: prefix + 12 hex chars) for a low-level image dict."""
+    return image.get('Id', '')[:19]
+
+def image_tags(image):
+    """Real repo tags for a low-level image dict (dangling images have none)."""
+    tags = image.get('RepoTags') or []
+    return [t for t in tags if t != '<none>:<none>']
+
+# Detects glob metacharacters; patterns without any are plain literals
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+def compile_exclusion_patterns(patterns):
+    """Partition exclusion patterns into a literal set and one compiled regex.
+
+    Patterns without glob metacharacters (typically exact tags or ID prefixes)
+    go into a frozenset for O(1) hash lookups; the rest are compiled into a
+    single regex union so fnmatch doesn't re-translate the glob on every call.
+    Returns (literals, glob_re), or None when there are no patterns.
+    """
+    if not patterns:
+        return None
+    literals = frozenset(p for p in patterns if not _GLOB_CHARS.search(p))
+    globs = [p for p in patterns if _GLOB_CHARS.search(p)]
+    glob_re = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs)) if globs else None
+    return literals, glob_re
+
+def _matches_exclusion(value, literals, glob_re):
+    return value in literals or (glob_re is not None and glob_re.match(value))
+
+def should_exclude_image(image, exclusion):
+    """Check if an image should be excluded based on compiled exclusion patterns."""
+    if exclusion is None:
         return False
-    
-    # Check against image tags (handle cases where image.tags might be None or empty)
-    tags = image.tags or []
-    for tag in tags:
-        for pattern in exclusion_patterns:
-            if fnmatch.fnmatch(tag, pattern):
-                logger.info(f"Excluding image {image.short_id} - tag '{tag}' matches pattern '{pattern}'")
-                return True
-    
-    # Check against image ID
-    for pattern in exclusion_patterns:
-        if fnmatch.fnmatch(image.short_id, pattern):
-            logger.info(f"Excluding image {image.short_id} - ID matches pattern '{pattern}'")
+    literals, glob_re = exclusion
+
+    # Check the image ID first - it's a single string, cheaper than iterating tags
+    short_id = image_short_id(image)
+    if _matches_exclusion(short_id, literals, glob_re):
+        logger.info(f"Excluding image {short_id} - ID matches an exclusion pattern")
+        return True
+
+    # Single pass over the tags (dangling images have no tags to match)
+    for tag in image_tags(image):
+        if _matches_exclusion(tag, literals, glob_re):
+            logger.info(f"Excluding image {short_id} - tag '{tag}' matches an exclusion pattern")
             return True
-    
+
     # For now, let's be less aggressive and only exclude 'latest' if explicitly in exclusion patterns
     # We'll remove the automatic exclusions to see what images we have
-    
+
     return False
 
 def backup_image_info(images, backup_file):
-    """Backup image information before deletion."""
-    backup_data = {
-        "timestamp": datetime.now().isoformat(),
-        "images": []
-    }
-    
-    for image in images:
-        image_info = {
-            "id": image.id,
-            "short_id": image.short_id,
-            "tags": image.tags,
-            "created": image.attrs.get('Created', ''),
-            "size": image.attrs.get('Size', 0),
-            "labels": image.attrs.get('Config', {}).get('Labels') or {}
-        }
-        backup_data["images"].append(image_info)
-    
+    """Backup image information before deletion.
+
+    The backup is NDJSON: a header line holding the timestamp followed by one
+    JSON object per image, so entries stream to disk one at a time instead of
+    building the whole payload in memory first.
+    """
     try:
         os.makedirs(os.path.dirname(backup_file), exist_ok=True)
-        with open(backup_file, 'w') as f:
-            json.dump(backup_data, f, indent=2)
-        logger.info(f"Backed up {len(images)} image(s) info to {backup_file}")
+        count = 0
+        with open(backup_file, 'wb') as f:
+            f.write(config.json_dumps({"timestamp": datetime.now().isoformat()}, indent=None) + b'\n')
+            for image in images:
+                image_info = {
+                    "id": image.get('Id', ''),
+                    "short_id": image_short_id(image),
+                    "tags": image_tags(image),
+                    "created": image.get('Created', 0),
+                    "size": image.get('Size', 0),
+                    "labels": image.get('Labels') or {}
+                }
+                f.write(config.json_dumps(image_info, indent=None) + b'\n')
+                count += 1
+        logger.info(f"Backed up {count} image(s) info to {backup_file}")
     except Exception as e:
         logger.error(f"Failed to backup image info: {e}")
 
-def get_unused_images(client, age_threshold_days: int, exclusion_patterns=None):
-    """Returns a list of unused images older than the threshold."""
-    if exclusion_patterns is None:
-        exclusion_patterns = []
-        
+def get_unused_images(client, age_threshold_days: int, exclusion_patterns=None, filters=None):
+    """Returns a list of unused images older than the threshold.
+
+    `filters` is passed straight to the Docker API image list (e.g.
+    {"dangling": True}) so callers can push a predicate server-side and
+    avoid transferring records that would be discarded here anyway. The
+    default stays unfiltered: a dangling-only listing would silently skip
+    tagged-but-unused images, which are exactly what this tool targets.
+    """
+    import docker
+
+    exclusion = compile_exclusion_patterns(exclusion_patterns)
+
     try:
-        # Get ALL images including dangling ones (these are often the biggest space wasters)
-        all_images = client.images.list(all=True)
-        containers = client.containers.list(all=True)
+        # Get ALL images including dangling ones (these are often the biggest space wasters).
+        # The low-level API returns plain dicts in a single round-trip, avoiding the lazy
+        # per-image attribute fetches that model objects can trigger.
+        all_images = client.api.images(all=True, filters=filters)
+        containers = client.api.containers(all=True)
         logger.info(f"Found {len(all_images)} total images and {len(containers)} containers")
     except docker.errors.DockerException as e:
         logger.error(f"Failed to connect to Docker daemon: {e}")
         return []
 
     # Get image IDs that are actually being used by containers
-    used_image_ids = set()
-    for container in containers:
-        used_image_ids.add(container.image.id)
-        logger.debug(f"Container {container.name} ({container.status}) uses image {container.image.short_id}")
-        # Also add parent image IDs if available
-        if hasattr(container.image, 'parent_id') and container.image.parent_id:
-            used_image_ids.add(container.image.parent_id)
+    used_image_ids = {container.get('ImageID', '') for container in containers}
 
     unused_images = []
-    threshold_date = datetime.now(timezone.utc) - timedelta(days=age_threshold_days)
-    logger.info(f"Using age threshold: {age_threshold_days} days (images older than {threshold_date})")
+    # 'Created' is a Unix epoch integer on the low-level list response, so the
+    # age filter is a single integer comparison - no date parsing needed.
+    now = time.time()
+    threshold_epoch = now - age_threshold_days * 86400
+    logger.info(f"Using age threshold: {age_threshold_days} days (images created before epoch {threshold_epoch:.0f})")
+
+    MB = 1.0 / (1024 * 1024)
+    dbg = logger.isEnabledFor(logging.DEBUG)
 
     for image in all_images:
-        image_tags = image.tags if image.tags else ["<dangling>"]
-        size_mb = image.attrs.get('Size', 0) / (1024 * 1024)
-        
-        # Parse creation date
-        created_time_str = image.attrs['Created']
-        try:
-            # Try parsing as-is first (most common case)
-            if created_time_str.endswith('Z'):
-                # Replace Z with +00:00 for proper ISO format
-                created_time_str = created_time_str.replace('Z', '+00:00')
-            elif '+00:00' in created_time_str and created_time_str.count('+00:00') > 1:
-                # Fix double timezone issue
-                created_time_str = created_time_str.replace('+00:00+00:00', '+00:00')
-            
-            # Remove nanoseconds if present (keep only microseconds)
-            if '.' in created_time_str:
-                date_part, time_part = created_time_str.split('.')
-                if '+' in time_part:
-                    time_microseconds, tz_part = time_part.split('+', 1)
-                    time_microseconds = time_microseconds[:6]  # Keep only 6 digits (microseconds)
-                    created_time_str = f"{date_part}.{time_microseconds}+{tz_part}"
-                elif 'Z' in time_part:
-                    time_microseconds = time_part.replace('Z', '')[:6]
-                    created_time_str = f"{date_part}.{time_microseconds}+00:00"
-            
-            created_time = datetime.fromisoformat(created_time_str)
-        except ValueError as e:
-            logger.warning(f"Failed to parse timestamp '{image.attrs['Created']}' for image {image.short_id}: {e}")
-            # Fallback: assume image is new if we can't parse the date
+        # Check if image is in use before doing any per-image formatting work
+        if image.get('Id') in used_image_ids:
+            if dbg:
+                logger.debug("USED: Image %s with tags: %s", image_short_id(image), image_tags(image) or ["<dangling>"])
             continue
 
-        # Check if image is in use
-        if image.id in used_image_ids:
-            logger.debug(f"USED: Image {image.short_id} with tags: {image_tags} (Size: {size_mb:.2f} MB, Created: {created_time.strftime('%Y-%m-%d')})")
-            continue
-            
+        short_id = image_short_id(image)
+        tags = image_tags(image) or ["<dangling>"]
+        size_mb = image.get('Size', 0) * MB
+        created = image.get('Created', 0)
+
         # Check exclusion patterns
-        if should_exclude_image(image, exclusion_patterns):
-            logger.info(f"EXCLUDED: Image {image.short_id} with tags: {image_tags} due to exclusion rules")
+        if should_exclude_image(image, exclusion):
+            logger.info(f"EXCLUDED: Image {short_id} with tags: {tags} due to exclusion rules")
             continue
-            
+
         # Check age
-        if created_time >= threshold_date:
-            days_old = (datetime.now(timezone.utc) - created_time).days
-            logger.info(f"TOO_NEW: Image {image.short_id} with tags: {image_tags} is only {days_old} days old (Size: {size_mb:.2f} MB)")
+        days_old = int((now - created) // 86400)
+        if created >= threshold_epoch:
+            logger.info(f"TOO_NEW: Image {short_id} with tags: {tags} is only {days_old} days old (Size: {size_mb:.2f} MB)")
             continue
-            
+
         # If we get here, the image is unused and old enough
-        days_old = (datetime.now(timezone.utc) - created_time).days
-        logger.info(f"UNUSED: Image {image.short_id} with tags: {image_tags} is {days_old} days old (Size: {size_mb:.2f} MB)")
+        logger.info(f"UNUSED: Image {short_id} with tags: {tags} is {days_old} days old (Size: {size_mb:.2f} MB)")
         unused_images.append(image)
 
     logger.info(f"Found {len(unused_images)} unused images out of {len(all_images)} total images")
     return unused_images
 
-    return unused_images
+# Shared Docker client, reused across daemon cycles to avoid rebuilding the
+# socket session and re-negotiating the API version every cleanup.
+_client = None
 
-def cleanup_images(dry_run=None):
+def _get_client():
+    """Return the shared Docker client, reconnecting if the cached one died."""
+    global _client
+    import docker
+
+    if _client is not None:
+        try:
+            _client.ping()
+            return _client
+        except docker.errors.DockerException:
+            _client = None
+    _client = docker.from_env()
+    _client.ping() # Verify connection
+    return _client
+
+def cleanup_images(dry_run=None, cfg=None):
     """Performs the image cleanup process."""
+    # Imported here so daemon/dry-run startup doesn't pay for the docker
+    # package (requests, urllib3, websocket) until it's actually needed.
+    import docker
+
+    _ensure_logging()
     logger.info("Starting Docker image cleanup cycle.")
-    cfg = config.load_config()
+    if cfg is None:
+        cfg = config.load_config()
     age_threshold = cfg.get("image_age_threshold_days", 30)
     exclusion_patterns = cfg.get("excluded_image_patterns", [])
     backup_enabled = cfg.get("backup_enabled", True)
@@ -236,8 +285,7 @@ def cleanup_images(dry_run=None):
         logger.info("DRY-RUN MODE: Using 0 days age threshold to show all unused images")
 
     try:
-        client = docker.from_env()
-        client.ping() # Verify connection
+        client = _get_client()
     except docker.errors.DockerException as e:
         error_msg = str(e)
         if "Permission denied" in error_msg:
@@ -250,6 +298,19 @@ def cleanup_images(dry_run=None):
         logger.error(f"Unexpected error connecting to Docker: {e}")
         return
 
+    # Fast path: when there are no exclusions to honor and no backup to write,
+    # Docker can evaluate the age filter server-side and prune everything in a
+    # single call - unneeded image metadata never crosses the socket.
+    if not dry_run and not exclusion_patterns and not backup_enabled:
+        try:
+            result = client.api.prune_images(filters={'dangling': False, 'until': f'{age_threshold * 24}h'})
+            deleted = result.get('ImagesDeleted') or []
+            reclaimed_mb = result.get('SpaceReclaimed', 0) / (1024 * 1024)
+            logger.info(f"Server-side prune removed {len(deleted)} image(s), reclaimed {reclaimed_mb:.2f} MB")
+            return
+        except docker.errors.APIError as e:
+            logger.error(f"Server-side prune failed, falling back to list-and-filter: {e}")
+
     images_to_delete = get_unused_images(client, age_threshold, exclusion_patterns)
 
     if not images_to_delete:
@@ -262,11 +323,11 @@ def cleanup_images(dry_run=None):
         logger.info("DRY RUN MODE - No images will actually be deleted:")
         total_size = 0
         for image in images_to_delete:
-            tags = image.tags if image.tags else ["<dangling>"]
-            size_mb = image.attrs.get('Size', 0) / (1024 * 1024)
-            total_size += image.attrs.get('Size', 0)
-            created_str = image.attrs.get('Created', 'unknown')
-            logger.info(f"Would delete image {image.short_id} with tags: {tags} (Size: {size_mb:.2f} MB, Created: {created_str})")
+            tags = image_tags(image) or ["<dangling>"]
+            size_mb = image.get('Size', 0) / (1024 * 1024)
+            total_size += image.get('Size', 0)
+            created_str = datetime.fromtimestamp(image.get('Created', 0), tz=timezone.utc).isoformat()
+            logger.info(f"Would delete image {image_short_id(image)} with tags: {tags} (Size: {size_mb:.2f} MB, Created: {created_str})")
         total_size_mb = total_size / (1024 * 1024)
         logger.info(f"Total space that would be freed: {total_size_mb:.2f} MB")
         return
@@ -275,23 +336,61 @@ def cleanup_images(dry_run=None):
     if backup_enabled:
         backup_image_info(images_to_delete, backup_file)
 
-    for image in images_to_delete:
+    dangling = [image for image in images_to_delete if not image_tags(image)]
+    tagged = [image for image in images_to_delete if image_tags(image)]
+
+    # Dangling images can be removed with a single server-side prune call as
+    # long as no exclusion patterns are configured (prune can't honor them).
+    if dangling and not exclusion_patterns:
         try:
-            tags = image.tags if image.tags else ["<dangling>"]
-            size_mb = image.attrs.get('Size', 0) / (1024 * 1024)
-            logger.info(f"Deleting image {image.short_id} with tags: {tags} (Size: {size_mb:.2f} MB)")
-            client.images.remove(image.id, force=True) # Force to remove even if tagged
-            logger.info(f"Successfully deleted image {image.short_id}")
+            result = client.api.prune_images(filters={'dangling': True, 'until': f'{age_threshold * 24}h'})
+            deleted = result.get('ImagesDeleted') or []
+            reclaimed_mb = result.get('SpaceReclaimed', 0) / (1024 * 1024)
+            logger.info(f"Pruned {len(deleted)} dangling image(s) in one call, reclaimed {reclaimed_mb:.2f} MB")
         except docker.errors.APIError as e:
-            logger.error(f"Failed to delete image {image.short_id}: {e}")
+            logger.error(f"Failed to prune dangling images, falling back to individual removal: {e}")
+            tagged = tagged + dangling
+    elif dangling:
+        # Exclusion patterns may match short IDs of dangling images, so delete
+        # them individually alongside the tagged ones.
+        tagged = tagged + dangling
+
+    if not tagged:
+        return
+
+    def _remove(image):
+        tags = image_tags(image) or ["<dangling>"]
+        size_mb = image.get('Size', 0) / (1024 * 1024)
+        logger.info(f"Deleting image {image_short_id(image)} with tags: {tags} (Size: {size_mb:.2f} MB)")
+        client.images.remove(image.get('Id'), force=True) # Force to remove even if tagged
+
+    # Each removal is a blocking HTTP round-trip; overlap them with a small pool
+    with ThreadPoolExecutor(max_workers=min(8, len(tagged))) as executor:
+        futures = {executor.submit(_remove, image): image for image in tagged}
+        for future in as_completed(futures):
+            short_id = image_short_id(futures[future])
+            try:
+                future.result()
+                logger.info(f"Successfully deleted image {short_id}")
+            except docker.errors.APIError as e:
+                logger.error(f"Failed to delete image {short_id}: {e}")
+
+# Set by the SIGTERM handler so the daemon loop wakes up and exits cleanly
+_stop = threading.Event()
 
 def run_daemon():
     """The main loop for the daemon process."""
+    _ensure_logging()
+    # An interruptible wait lets systemd stop the daemon with SIGTERM instead
+    # of having to SIGKILL it out of a day-long time.sleep.
+    signal.signal(signal.SIGTERM, lambda *_: _stop.set())
     logger.info("Docker Janitor daemon started.")
-    while True:
-        cleanup_images()
-        
+    while not _stop.is_set():
         cfg = config.load_config()
+        cleanup_images(cfg=cfg)
+
         sleep_interval = cfg.get("daemon_sleep_interval_seconds", 86400)
         logger.info(f"Sleeping for {sleep_interval} seconds...")
-        time.sleep(sleep_interval)
+        if _stop.wait(sleep_interval):
+            break
+    logger.info("Docker Janitor daemon stopped.")
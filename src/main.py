@@ -5,19 +5,15 @@ import os
 
 # Add the current directory to Python path for relative imports
 if __name__ == "__main__":
-    # When running directly, add the parent directory to path
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    if parent_dir not in sys.path:
+    if current_dir not in sys.path:
         sys.path.insert(0, current_dir)
 
 # Try relative imports first, fall back to absolute imports
 try:
     from . import daemon
-    from . import tui
 except ImportError:
     import daemon
-    import tui
 
 app = typer.Typer()
 
@@ -35,7 +31,12 @@ def main(
         # Run one-time cleanup in dry-run mode
         daemon.cleanup_images(dry_run=True)
     else:
-        # Launch the Textual TUI application
+        # Launch the Textual TUI application. Imported here so --daemon and
+        # --dry-run invocations don't pay the Textual import cost.
+        try:
+            from . import tui
+        except ImportError:
+            import tui
         app = tui.DockerJanitorApp()
         app.run()
 
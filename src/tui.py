@@ -1,4 +1,6 @@
 from textual.app import App, ComposeResult, on
+from textual import work
+from textual.worker import get_current_worker
 from textual.widgets import Header, Footer, Static, TabbedContent, TabPane, Input, Button, DataTable, Switch, ProgressBar, Label
 from textual.containers import Vertical, Horizontal, Container, ScrollableContainer
 from textual.binding import Binding
@@ -6,12 +8,12 @@ from textual.reactive import reactive
 from textual.coordinate import Coordinate
 import subprocess
 import docker
+import functools
 import os
-import json
-from pathlib import Path
+import re
 from datetime import datetime
-import asyncio
-import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Try relative imports first, fall back to absolute imports
 try:
@@ -23,8 +25,36 @@ except ImportError:
 
 LOG_FILE = "/var/log/docker-janitor.log"
 
+# Matches the daemon's log format: "date time - logger - LEVEL - message",
+# capturing the time, level, and message in one pass
+_LOG_RE = re.compile(r"^\S+ (\S+) - [\w.]+ - (\w+) - (.*)$")
+
+# Dashboard markup built once at import; ticks only pick a constant or
+# interpolate a value into a template instead of rebuilding f-strings
+_SVC_TEXTS = {
+    "active": "Service Status\n[bold green]● RUNNING[/bold green]",
+    "inactive": "Service Status\n[bold yellow]⏸ STOPPED[/bold yellow]",
+    "unknown": "Service Status\n[bold yellow]? UNKNOWN[/bold yellow]",
+}
+_SVC_TEXT_FAILED = "Service Status\n[bold red]✗ {}[/bold red]"
+_IMAGES_TEXT = "Total Images\n[bold blue]{}[/bold blue]"
+_IMAGES_TEXT_ERROR = "Total Images\n[bold red]Error[/bold red]"
+_SPACE_TEXT = "Space Used\n[bold blue]{}[/bold blue]"
+_SPACE_TEXT_ERROR = "Space Used\n[bold red]Error[/bold red]"
+_NEXT_TEXT = "Next Cleanup\n[bold blue]{}h[/bold blue]"
+_LEVEL_MARKUP = {
+    "ERROR": "[red]ERROR[/red]",
+    "WARNING": "[yellow]WARNING[/yellow]",
+    "INFO": "[green]INFO[/green]",
+}
+
+@functools.lru_cache(maxsize=1)
 def get_log_file():
-    """Get the log file path with fallback options."""
+    """Get the log file path with fallback options.
+
+    Cached for the life of the process: the dashboard calls this every
+    tick and the chosen path doesn't change mid-run.
+    """
     primary_log = "/var/log/docker-janitor.log"
     fallback_log = os.path.expanduser("~/.docker-janitor.log")
     
@@ -35,24 +65,53 @@ def get_log_file():
     else:
         return primary_log  # Default, even if it doesn't exist
 
+def _tail_lines(fd, n=15, block=8192):
+    """Return the last n lines of an open fd without reading the whole file.
+
+    Reads backward in fixed-size os.pread chunks until enough newlines are
+    found, so a multi-megabyte log costs a few KB per refresh with no
+    buffered-IO layer or open/close per tick.
+    """
+    pos = os.fstat(fd).st_size
+    buf = b""
+    while pos > 0 and buf.count(b"\n") <= n:
+        step = min(block, pos)
+        pos -= step
+        buf = os.pread(fd, step, pos) + buf
+    return buf.decode(errors="replace").splitlines()[-n:]
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@functools.lru_cache(maxsize=4096)
 def format_size(bytes_size):
     """Format bytes to human readable string."""
-    if bytes_size is None or bytes_size == 0:
+    if not bytes_size:
         return "0 B"
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
-
-def format_age(created_str):
-    """Format creation date to relative age."""
+    # One unit step per 10 bits (1 KB = 2**10), so the unit index falls
+    # straight out of the bit length - no division loop
+    exp = min((int(bytes_size).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes_size / (1 << (exp * 10)):.1f} {_UNITS[exp]}"
+
+def format_age(created):
+    """Format creation date (ISO string or Unix epoch) to relative age."""
+    return _format_age(created, datetime.now().toordinal())
+
+@functools.lru_cache(maxsize=4096)
+def _format_age(created, today):
+    """Memoized body of format_age, keyed on the value and today's date.
+
+    Many images in one scan share a Created timestamp, so the date parse
+    runs once per unique value; keying on the day keeps entries from
+    going stale overnight.
+    """
     try:
-        # Parse the ISO date from Docker API
-        if 'T' in created_str:
-            created_str = created_str.split('T')[0]
-        created = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-        age_days = (datetime.now() - created.replace(tzinfo=None)).days
+        if isinstance(created, (int, float)):
+            created_day = datetime.fromtimestamp(created).toordinal()
+        else:
+            # Only the calendar day matters here, so parse just the
+            # YYYY-MM-DD prefix of the ISO string - no time zone handling
+            created_day = datetime.fromisoformat(created[:10]).toordinal()
+        age_days = today - created_day
         if age_days == 0:
             return "Today"
         elif age_days == 1:
@@ -66,7 +125,7 @@ def format_age(created_str):
             months = age_days // 30
             return f"{months} month{'s' if months > 1 else ''} ago"
     except:
-        return created_str
+        return str(created)
 
 class DockerJanitorApp(App):
     """The main Textual application for Docker Janitor."""
@@ -74,118 +133,7 @@ class DockerJanitorApp(App):
     TITLE = "🐳 Docker Janitor"
     SUB_TITLE = "Your smart Docker image cleaner"
     
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-    
-    Header {
-        background: $primary;
-        color: $text;
-        text-style: bold;
-    }
-    
-    Footer {
-        background: $primary-darken-2;
-        color: $text;
-    }
-    
-    TabbedContent {
-        height: 100%;
-    }
-    
-    TabPane {
-        padding: 1;
-    }
-    
-    .panel {
-        background: $surface-lighten-1;
-        border: round $primary;
-        padding: 1;
-        margin: 1;
-    }
-    
-    .metric-box {
-        background: $primary-darken-1;
-        color: $text;
-        text-align: center;
-        text-style: bold;
-        padding: 1;
-        border: round $secondary;
-        margin: 0 1;
-        height: 3;
-    }
-    
-    .status-good {
-        background: $success;
-        color: $text;
-    }
-    
-    .status-bad {
-        background: $error;
-        color: $text;
-    }
-    
-    .status-warning {
-        background: $warning;
-        color: $text;
-    }
-    
-    Button {
-        margin: 0 1 1 0;
-        text-style: bold;
-    }
-    
-    DataTable {
-        border: round $primary;
-        margin: 1 0;
-    }
-    
-    DataTable .datatable--header {
-        background: $primary-darken-1;
-        text-style: bold;
-    }
-    
-    DataTable .datatable--cursor {
-        background: $secondary;
-    }
-    
-    ProgressBar {
-        margin: 1 0;
-        border: round $primary;
-    }
-    
-    Input {
-        border: round $primary;
-        margin: 0 1 1 0;
-    }
-    
-    #metrics-row {
-        height: 5;
-        margin: 1 0;
-    }
-    
-    #button-row {
-        height: auto;
-        margin: 1 0;
-    }
-    
-    .form-row {
-        height: auto;
-        margin: 1 0;
-    }
-    
-    .form-label {
-        width: 25%;
-        text-align: right;
-        text-style: bold;
-        content-align: center middle;
-    }
-    
-    .form-input {
-        width: 75%;
-    }
-    """
+    CSS_PATH = "tui.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit", priority=True),
@@ -196,7 +144,6 @@ class DockerJanitorApp(App):
     ]
 
     # --- Reactive variables ---
-    selected_images = reactive(set)
     scanning = reactive(False)
 
     def compose(self) -> ComposeResult:
@@ -277,18 +224,154 @@ class DockerJanitorApp(App):
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
+        self._log_sig = (0, 0)
+        self._svc_cache = (0.0, None)
+        self._dash_sig = None
+        # In-memory config snapshot; refreshed only when settings are saved
+        self._cfg = config.load_config()
+        self._docker = None
+        self._log_fd = None
+        # One pool for all image-removal fan-out; reusing it (and the one
+        # Docker client) keeps threads and HTTP keep-alive connections warm
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        # Row-index -> image id mapping for the scan table; selection stores
+        # small ints instead of hashing 64-char id strings per toggle
+        self._row_ids = []
+        # Plain set: selection changes already update the affected widgets
+        # explicitly, so reactive watcher machinery would be pure overhead
+        self.selected_images = set()
+        self._btn_dirty = False
+        # Checkbox cell writes queued between flushes of the selection UI
+        self._pending_checkbox = {}
+        # Last backup summary keyed by the file's mtime; re-reading the
+        # file is only needed after the daemon writes a new backup
+        self._backup_cache = None
+        # Sizes captured during the last scan so selection totals never
+        # issue per-image inspect round-trips to the daemon
+        self._size_cache = {}
+        # Running total of selected image sizes, adjusted on each toggle
+        self._selected_bytes = 0
+
+        # Bind frequently-used widgets once; query_one walks the widget tree
+        # and matches selectors on every call
+        self._w_service = self.query_one("#service-status", Static)
+        self._w_total_images = self.query_one("#total-images", Static)
+        self._w_space_used = self.query_one("#space-used", Static)
+        self._w_next_cleanup = self.query_one("#next-cleanup", Static)
+        self._w_log_table = self.query_one("#log-table", DataTable)
+        self._w_image_table = self.query_one("#image-table", DataTable)
+        self._w_scan_progress = self.query_one("#scan-progress", ProgressBar)
+        self._w_scan_status = self.query_one("#scan-status", Static)
+        self._w_settings_status = self.query_one("#settings-status", Static)
+        self._w_delete_status = self.query_one("#delete-status", Static)
+        self._w_selection_info = self.query_one("#selection-info", Static)
+        self._w_delete_button = self.query_one("#delete-selected", Button)
+        self._w_interval_input = self.query_one("#interval-input", Input)
+        self._w_age_input = self.query_one("#age-input", Input)
+        self._w_dry_run_switch = self.query_one("#dry-run-switch", Switch)
+        self._w_exclusions_input = self.query_one("#exclusions-input", Input)
+
+        # Pre-allocate table columns once instead of re-checking on every refresh
+        self._w_log_table.add_columns("🕐 Time", "📊 Level", "💬 Message")
+        # Fixed widths let Textual skip the per-row auto-size measurement
+        # pass when a scan inserts hundreds of rows
+        self._w_image_table.add_column("Select", width=6)
+        self._w_image_table.add_column("🆔 Image ID", width=14)
+        self._w_image_table.add_column("🏷️ Tags", width=40)
+        self._w_image_table.add_column("💾 Size", width=10)
+        self._w_image_table.add_column("📅 Age", width=12)
+
         self.update_dashboard()
         self.load_settings()
-        self.set_interval(10, self.update_dashboard)
-        
+        # Docker events push refreshes as they happen; the interval is only
+        # a safety net for anything the event stream misses
+        self._dirty = False
+        self._watch_events()
+        self._dash_timer = self.set_interval(60, self.update_dashboard)
+
         # Hide progress bar initially
-        progress = self.query_one("#scan-progress")
-        progress.display = False
+        self._w_scan_progress.display = False
+
+    def docker_client(self):
+        """Lazily create and reuse a single Docker client for the whole app."""
+        if self._docker is None:
+            self._docker = docker.from_env()
+        return self._docker
+
+    def _invalidate_client(self):
+        """Drop the cached client so the next call opens a fresh session."""
+        if self._docker is not None:
+            try:
+                self._docker.close()
+            except Exception:
+                pass
+            self._docker = None
+
+    def on_unmount(self) -> None:
+        """Close the shared Docker client and log fd when the app exits."""
+        if self._docker is not None:
+            try:
+                self._docker.close()
+            except Exception:
+                pass
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+        self._pool.shutdown(wait=False)
+
+    def _log_tail_fd(self, path):
+        """Return a persistent read-only fd for path, reopening on rotation."""
+        fd = self._log_fd
+        if fd is not None:
+            try:
+                if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                    return fd
+            except OSError:
+                pass
+            os.close(fd)
+            self._log_fd = None
+        self._log_fd = os.open(path, os.O_RDONLY)
+        return self._log_fd
+
+    @work(thread=True, exclusive=True, group="events")
+    def _watch_events(self):
+        """Refresh the dashboard when dockerd reports image/container churn."""
+        worker = get_current_worker()
+        while not worker.is_cancelled:
+            try:
+                client = self.docker_client()
+                for _ in client.events(decode=True, filters={"type": ["image", "container"]}):
+                    if worker.is_cancelled:
+                        return
+                    self.call_from_thread(self._mark_dirty)
+            except Exception:
+                self._invalidate_client()
+                time.sleep(5)
+
+    def _mark_dirty(self):
+        """Coalesce a burst of Docker events into one dashboard refresh."""
+        if not self._dirty:
+            self._dirty = True
+            self.set_timer(1.0, self._refresh_dirty)
+
+    def _refresh_dirty(self):
+        self._dirty = False
+        self.update_dashboard()
 
     def action_refresh(self) -> None:
         """Refresh current view."""
+        self._dash_sig = None  # force a repaint even if nothing changed
         self.update_dashboard()
 
+    @on(TabbedContent.TabActivated)
+    def handle_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Run the periodic dashboard refresh only while its tab is visible."""
+        pane = self.query_one(TabbedContent).active_pane
+        if pane is not None and pane.id == "dashboard":
+            self._dash_timer.resume()
+            self.update_dashboard()
+        else:
+            self._dash_timer.pause()
+
     def action_scan(self) -> None:
         """Trigger image scan."""
         current_tab = self.query_one(TabbedContent).active_pane
@@ -296,86 +379,131 @@ class DockerJanitorApp(App):
             self.run_scan()
 
     def update_dashboard(self):
-        """Updates the dashboard with current status and logs."""
-        try:
-            # 1. Update Service Status
+        """Refresh the dashboard; the blocking I/O runs on a worker thread."""
+        self._gather_dashboard()
+
+    @work(thread=True, exclusive=True, group="dashboard")
+    def _gather_dashboard(self):
+        """Collect dashboard data off the UI thread (blocking I/O lives here)."""
+        data = {}
+
+        # 1. Service Status. The systemctl fork+exec dominates the tick cost
+        # and the state rarely changes, so cache it for 30 s.
+        now = time.monotonic()
+        cached_at, status = self._svc_cache
+        if status is None or now - cached_at > 30:
             try:
-                result = subprocess.run(["systemctl", "is-active", "docker-janitor.service"], 
+                result = subprocess.run(["systemctl", "is-active", "docker-janitor.service"],
                                       capture_output=True, text=True, timeout=5)
                 status = result.stdout.strip()
-                if status == "active":
-                    self.query_one("#service-status").update("Service Status\n[bold green]● RUNNING[/bold green]")
-                elif status == "inactive":
-                    self.query_one("#service-status").update("Service Status\n[bold yellow]⏸ STOPPED[/bold yellow]")
-                else:
-                    self.query_one("#service-status").update(f"Service Status\n[bold red]✗ {status.upper()}[/bold red]")
             except (FileNotFoundError, subprocess.TimeoutExpired):
-                self.query_one("#service-status").update("Service Status\n[bold yellow]? UNKNOWN[/bold yellow]")
+                status = "unknown"
+            self._svc_cache = (now, status)
+        data["status"] = status
 
-            # 2. Update Docker Stats
-            try:
-                client = docker.from_env()
-                images = client.images.list(all=True)
-                total_size = sum(img.attrs.get('Size', 0) for img in images)
-                
-                self.query_one("#total-images").update(f"Total Images\n[bold blue]{len(images)}[/bold blue]")
-                self.query_one("#space-used").update(f"Space Used\n[bold blue]{format_size(total_size)}[/bold blue]")
-            except Exception:
-                self.query_one("#total-images").update("Total Images\n[bold red]Error[/bold red]")
-                self.query_one("#space-used").update("Space Used\n[bold red]Error[/bold red]")
-
-            # 3. Update Next Check Time
-            cfg = config.load_config()
-            interval = cfg.get("daemon_sleep_interval_seconds", 86400)
-            hours = int(interval/3600)
-            self.query_one("#next-cleanup").update(f"Next Cleanup\n[bold blue]{hours}h[/bold blue]")
-
-            # 4. Update Log Table
-            log_table = self.query_one("#log-table")
-            if not log_table.columns:
-                log_table.add_columns("🕐 Time", "📊 Level", "💬 Message")
-            log_table.clear()
-            
-            log_file_path = get_log_file()
+        # 2. Docker Stats. /system/df returns pre-aggregated image records,
+        # so dockerd does the counting instead of serializing every image
+        # JSON across the socket each tick.
+        try:
+            client = self.docker_client()
+            df_images = client.df().get("Images") or []
+            data["total_images"] = len(df_images)
+            data["total_size"] = sum(img.get("Size", 0) for img in df_images)
+        except Exception:
+            data["total_images"] = None
+            self._invalidate_client()
+
+        # 3. Next Check Time
+        cfg = self._cfg
+        data["interval_hours"] = int(cfg.get("daemon_sleep_interval_seconds", 86400) / 3600)
+
+        # 4. Log tail - only re-read when the file changed since last tick
+        log_file_path = get_log_file()
+        try:
+            st = os.stat(log_file_path)
+            sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig = None
+        if sig != self._log_sig:
+            self._log_sig = sig
+            rows = []
             try:
-                with open(log_file_path, "r") as f:
-                    lines = f.readlines()
-                    for line in lines[-15:]:
-                        if " - " in line:
-                            parts = line.strip().split(" - ", 2)
-                            if len(parts) >= 3:
-                                timestamp = parts[0].split()[-1] if parts[0] else ""
-                                level = parts[1]
-                                message = parts[2][:60] + "..." if len(parts[2]) > 60 else parts[2]
-                                
-                                # Color code levels
-                                if "ERROR" in level:
-                                    level = f"[red]{level}[/red]"
-                                elif "WARNING" in level:
-                                    level = f"[yellow]{level}[/yellow]"
-                                elif "INFO" in level:
-                                    level = f"[green]{level}[/green]"
-                                
-                                log_table.add_row(timestamp, level, message)
+                for line in _tail_lines(self._log_tail_fd(log_file_path), n=15):
+                    m = _LOG_RE.match(line)
+                    if not m:
+                        continue
+                    timestamp, level, message = m.groups()
+                    if len(message) > 60:
+                        message = message[:60] + "..."
+                    rows.append((timestamp, _LEVEL_MARKUP.get(level, level), message))
             except FileNotFoundError:
-                log_table.add_row("", "[red]ERROR[/red]", f"Log file not found: {log_file_path}")
-        except Exception as e:
+                rows.append(("", "[red]ERROR[/red]", f"Log file not found: {log_file_path}"))
+            data["log_rows"] = rows
+
+        # Steady state: identical status, totals, and log tail mean the
+        # widgets would be rewritten with what they already show - skip the
+        # UI-thread hop altogether
+        dash_sig = (data["status"], data.get("total_images"), data.get("total_size"), self._log_sig)
+        if "log_rows" not in data and dash_sig == self._dash_sig:
+            return
+        self._dash_sig = dash_sig
+        self.call_from_thread(self._apply_dashboard, data)
+
+    def _set_text(self, cache_attr, widget, text):
+        """Update a Static only when its text actually changed.
+
+        Every Static.update marks the widget dirty and schedules a repaint,
+        so identical re-renders on each tick are worth skipping.
+        """
+        if getattr(self, cache_attr, None) != text:
+            setattr(self, cache_attr, text)
+            widget.update(text)
+
+    def _apply_dashboard(self, data):
+        """Write gathered dashboard data into the widgets (UI thread only)."""
+        try:
+            with self.batch_update():
+                self._render_dashboard(data)
+        except Exception:
             # Fallback if anything fails
             pass
 
+    def _render_dashboard(self, data):
+        """Apply gathered values to the dashboard widgets."""
+        status = data["status"]
+        svc_text = _SVC_TEXTS.get(status) or _SVC_TEXT_FAILED.format(status.upper())
+        self._set_text("_svc_text", self._w_service, svc_text)
+
+        if data.get("total_images") is None:
+            images_text = _IMAGES_TEXT_ERROR
+            space_text = _SPACE_TEXT_ERROR
+        else:
+            images_text = _IMAGES_TEXT.format(data["total_images"])
+            space_text = _SPACE_TEXT.format(format_size(data["total_size"]))
+        self._set_text("_images_text", self._w_total_images, images_text)
+        self._set_text("_space_text", self._w_space_used, space_text)
+
+        self._set_text("_next_text", self._w_next_cleanup,
+                       _NEXT_TEXT.format(data["interval_hours"]))
+
+        if "log_rows" in data:
+            log_table = self._w_log_table
+            log_table.clear()
+            log_table.add_rows(data["log_rows"])
+
     def load_settings(self):
         """Loads settings into the input fields."""
         try:
-            cfg = config.load_config()
+            cfg = self._cfg
             interval_hours = cfg.get("daemon_sleep_interval_seconds", 86400) / 3600
             age_days = cfg.get("image_age_threshold_days", 3)
             dry_run = cfg.get("dry_run_mode", False)
             exclusions = cfg.get("excluded_image_patterns", [])
             
-            self.query_one("#interval-input").value = str(int(interval_hours))
-            self.query_one("#age-input").value = str(age_days)
-            self.query_one("#dry-run-switch").value = dry_run
-            self.query_one("#exclusions-input").value = ",".join(exclusions)
+            self._w_interval_input.value = str(int(interval_hours))
+            self._w_age_input.value = str(age_days)
+            self._w_dry_run_switch.value = dry_run
+            self._w_exclusions_input.value = ",".join(exclusions)
         except Exception:
             pass
 
@@ -405,44 +533,48 @@ class DockerJanitorApp(App):
 
     def save_settings(self):
         """Save configuration settings."""
-        status = self.query_one("#settings-status")
+        status = self._w_settings_status
         try:
-            interval_hours = int(self.query_one("#interval-input").value or "24")
-            age_days = int(self.query_one("#age-input").value or "3")
-            dry_run = self.query_one("#dry-run-switch").value
-            exclusions_text = self.query_one("#exclusions-input").value
+            interval_hours = int(self._w_interval_input.value or "24")
+            age_days = int(self._w_age_input.value or "3")
+            dry_run = self._w_dry_run_switch.value
+            exclusions_text = self._w_exclusions_input.value
 
             if interval_hours <= 0 or age_days < 0:
                 status.update("[bold red]❌ Values must be positive.[/bold red]")
                 return
             
-            exclusions = [pattern.strip() for pattern in exclusions_text.split(",") if pattern.strip()]
+            exclusions = [p for pattern in exclusions_text.split(",") if (p := pattern.strip())]
+
+            config.set_config_values({
+                "daemon_sleep_interval_seconds": interval_hours * 3600,
+                "image_age_threshold_days": age_days,
+                "dry_run_mode": dry_run,
+                "excluded_image_patterns": exclusions,
+            })
+            self._cfg = config.load_config()
 
-            config.set_config_value("daemon_sleep_interval_seconds", interval_hours * 3600)
-            config.set_config_value("image_age_threshold_days", age_days)
-            config.set_config_value("dry_run_mode", dry_run)
-            config.set_config_value("excluded_image_patterns", exclusions)
-            
             status.update("[bold green]✅ Settings saved! Restart service to apply.[/bold green]")
         except ValueError:
             status.update("[bold red]❌ Invalid input. Please check values.[/bold red]")
 
     def test_config(self):
         """Test the configuration."""
-        status = self.query_one("#settings-status")
+        status = self._w_settings_status
         try:
-            interval_hours = int(self.query_one("#interval-input").value or "24")
-            age_days = int(self.query_one("#age-input").value or "3")
+            interval_hours = int(self._w_interval_input.value or "24")
+            age_days = int(self._w_age_input.value or "3")
             
             if interval_hours <= 0 or age_days < 0:
                 status.update("[bold red]❌ Invalid values.[/bold red]")
                 return
                 
-            client = docker.from_env()
+            client = self.docker_client()
             client.ping()
             
             status.update("[bold green]✅ Configuration valid![/bold green]")
         except docker.errors.DockerException:
+            self._invalidate_client()
             status.update("[bold red]❌ Cannot connect to Docker.[/bold red]")
         except ValueError:
             status.update("[bold red]❌ Invalid input values.[/bold red]")
@@ -451,17 +583,29 @@ class DockerJanitorApp(App):
 
     def restart_service(self):
         """Restart the Docker Janitor service."""
-        status = self.query_one("#settings-status")
-        status.update("🔄 Restarting service...")
+        self._w_settings_status.update("🔄 Restarting service...")
+        self._restart_worker()
+
+    @work(thread=True, exclusive=True, group="restart")
+    def _restart_worker(self):
+        """Run the blocking systemctl restart off the UI thread."""
+        status = self._w_settings_status
         try:
-            subprocess.run(["sudo", "systemctl", "restart", "docker-janitor.service"], 
+            subprocess.run(["sudo", "systemctl", "restart", "docker-janitor.service"],
                           check=True, timeout=10)
-            status.update("[bold green]✅ Service restarted![/bold green]")
-            self.update_dashboard()
         except subprocess.TimeoutExpired:
-            status.update("[bold red]❌ Restart timed out.[/bold red]")
+            self.call_from_thread(status.update, "[bold red]❌ Restart timed out.[/bold red]")
+            return
         except (subprocess.CalledProcessError, FileNotFoundError):
-            status.update("[bold red]❌ Failed to restart service.[/bold red]")
+            self.call_from_thread(status.update, "[bold red]❌ Failed to restart service.[/bold red]")
+            return
+        self._svc_cache = (0.0, None)  # force a fresh systemctl query
+        self.call_from_thread(self._apply_restart)
+
+    def _apply_restart(self):
+        """Report the restart and refresh the dashboard (UI thread only)."""
+        self._w_settings_status.update("[bold green]✅ Service restarted![/bold green]")
+        self.update_dashboard()
 
     def run_scan(self):
         """Scan for unused images."""
@@ -470,100 +614,123 @@ class DockerJanitorApp(App):
             
         self.scanning = True
         self.selected_images.clear()
+        self._selected_bytes = 0
         
         # Show progress and update UI
-        progress = self.query_one("#scan-progress")
+        progress = self._w_scan_progress
         progress.display = True
         progress.update(total=100, progress=10)
         
-        scan_status = self.query_one("#scan-status")
+        scan_status = self._w_scan_status
         scan_status.update("🔍 Scanning for unused images...")
         
-        image_table = self.query_one("#image-table")
-        image_table.clear()
-        if not image_table.columns:
-            image_table.add_columns("Select", "🆔 Image ID", "🏷️ Tags", "💾 Size", "📅 Age")
-        
+        self._w_image_table.clear()
+        self._scan_worker()
+
+    @work(thread=True, exclusive=True, group="scan")
+    def _scan_worker(self):
+        """Enumerate unused images off the UI thread and hand the rows back."""
+        progress = self._w_scan_progress
         try:
-            client = docker.from_env()
-            cfg = config.load_config()
+            client = self.docker_client()
+            cfg = self._cfg
             age_days = cfg.get("image_age_threshold_days", 3)
             exclusion_patterns = cfg.get("excluded_image_patterns", [])
-            
-            progress.update(progress=30)
+
+            self.call_from_thread(progress.update, progress=30)
             images_to_scan = daemon.get_unused_images(client, age_days, exclusion_patterns)
-            progress.update(progress=70)
-            
+            self.call_from_thread(progress.update, progress=70)
+
             total_size = 0
+            rows = []
             for image in images_to_scan:
-                tags = ", ".join(image.tags) if image.tags else "[dangling]"
+                image_tags = daemon.image_tags(image)
+                tags = ", ".join(image_tags) if image_tags else "[dangling]"
                 if len(tags) > 40:
                     tags = tags[:37] + "..."
-                    
-                size_bytes = image.attrs.get('Size', 0)
+
+                size_bytes = image.get('Size', 0)
                 size_str = format_size(size_bytes)
                 total_size += size_bytes
-                
-                created = image.attrs.get('Created', '')
+
+                created = image.get('Created', 0)
                 age_str = format_age(created)
-                
-                image_table.add_row(
-                    "☐",
-                    image.short_id.replace("sha256:", "")[:12],
-                    tags,
-                    size_str,
-                    age_str,
-                    key=image.id
-                )
-            
-            progress.update(progress=100)
-            progress.display = False
-            
-            if len(images_to_scan) == 0:
-                scan_status.update("✅ No unused images found!")
-            else:
-                scan_status.update(f"✅ Found {len(images_to_scan)} unused images ({format_size(total_size)} total)")
-            
-            self.update_selection_info()
-            
+
+                # Ids are 'sha256:' + 64 hex chars; one slice replaces the
+                # replace() intermediate and second slice per row
+                short_id = image.get('Id', '')[7:19]
+                rows.append((image.get('Id'), ("☐", short_id, tags, size_str, age_str)))
+
+            size_cache = {image.get('Id'): image.get('Size', 0) for image in images_to_scan}
+            self.call_from_thread(self._apply_scan, rows, size_cache, total_size)
         except Exception as e:
-            scan_status.update(f"[bold red]❌ Error: {str(e)[:40]}[/bold red]")
-            progress.display = False
-        finally:
-            self.scanning = False
+            self.call_from_thread(self._scan_failed, str(e))
+
+    def _apply_scan(self, rows, size_cache, total_size):
+        """Insert scan results into the table (UI thread only)."""
+        self._row_ids = [image_id for image_id, _ in rows]
+        self._size_cache = size_cache
+
+        # Row keys are needed for selection, so add_row stays - but inside
+        # one batch so Textual lays the table out once, not once per row
+        image_table = self._w_image_table
+        with self.batch_update():
+            for image_id, cells in rows:
+                image_table.add_row(*cells, key=image_id)
+
+        progress = self._w_scan_progress
+        progress.update(progress=100)
+        progress.display = False
+
+        if not rows:
+            self._w_scan_status.update("✅ No unused images found!")
+        else:
+            self._w_scan_status.update(f"✅ Found {len(rows)} unused images ({format_size(total_size)} total)")
+
+        self.update_selection_info()
+        self.scanning = False
+
+    def _scan_failed(self, message):
+        """Surface a scan error and reset the scan UI (UI thread only)."""
+        self._w_scan_status.update(f"[bold red]❌ Error: {message[:40]}[/bold red]")
+        self._w_scan_progress.display = False
+        self.scanning = False
 
     def update_selection_info(self):
         """Update selection information."""
-        selection_info = self.query_one("#selection-info")
+        selection_info = self._w_selection_info
         count = len(self.selected_images)
         
         if count == 0:
             selection_info.update("No images selected")
         else:
-            try:
-                client = docker.from_env()
-                total_size = 0
-                for image_id in self.selected_images:
-                    try:
-                        img = client.images.get(image_id)
-                        total_size += img.attrs.get('Size', 0)
-                    except:
-                        pass
-                selection_info.update(f"{count} selected ({format_size(total_size)})")
-            except:
-                selection_info.update(f"{count} selected")
+            # Maintained incrementally by on_image_selected; no Docker calls
+            selection_info.update(f"{count} selected ({format_size(self._selected_bytes)})")
 
     def run_dry_run_preview(self):
         """Run a dry-run preview."""
-        status = self.query_one("#delete-status")
-        status.update("🧪 Running dry-run preview...")
-        
+        self._w_delete_status.update("🧪 Running dry-run preview...")
+        self._cleanup_worker(dry_run=True)
+
+    @work(thread=True, exclusive=True, group="cleanup")
+    def _cleanup_worker(self, dry_run):
+        """Run a full daemon cleanup cycle off the UI thread."""
+        status = self._w_delete_status
         try:
-            daemon.cleanup_images(dry_run=True)
-            status.update("[bold green]✅ Dry-run completed. Check logs.[/bold green]")
-            self.update_dashboard()
+            daemon.cleanup_images(dry_run=dry_run)
         except Exception as e:
-            status.update(f"[bold red]❌ Error: {str(e)[:40]}[/bold red]")
+            self.call_from_thread(status.update, f"[bold red]❌ Error: {str(e)[:40]}[/bold red]")
+            return
+        self.call_from_thread(self._apply_cleanup, dry_run)
+
+    def _apply_cleanup(self, dry_run):
+        """Report the cleanup result and refresh views (UI thread only)."""
+        if dry_run:
+            self._w_delete_status.update("[bold green]✅ Dry-run completed. Check logs.[/bold green]")
+        else:
+            self._w_delete_status.update("[bold green]✅ Cleanup completed![/bold green]")
+            self.run_scan()
+        self._mark_dirty()
 
     @on(DataTable.RowSelected)
     def on_image_selected(self, event: DataTable.RowSelected):
@@ -571,102 +738,155 @@ class DockerJanitorApp(App):
         if event.data_table.id != "image-table":
             return
             
-        image_id = event.row_key.value
         row_index = event.cursor_row
-        
-        if image_id in self.selected_images:
-            self.selected_images.remove(image_id)
-            event.data_table.update_cell_at(Coordinate(row_index, 0), "☐")
+        size = self._size_cache.get(self._row_ids[row_index], 0)
+
+        if row_index in self.selected_images:
+            self.selected_images.remove(row_index)
+            self._selected_bytes -= size
+            self._pending_checkbox[row_index] = "☐"
         else:
-            self.selected_images.add(image_id)
-            event.data_table.update_cell_at(Coordinate(row_index, 0), "☑️")
+            self.selected_images.add(row_index)
+            self._selected_bytes += size
+            self._pending_checkbox[row_index] = "☑️"
         
+        # Coalesce rapid toggles into a single label/summary refresh
+        if not self._btn_dirty:
+            self._btn_dirty = True
+            self.call_after_refresh(self._flush_selection_ui)
+
+    def _flush_selection_ui(self):
+        """Apply queued checkbox cells and the selection count in one pass."""
+        self._btn_dirty = False
+        image_table = self._w_image_table
+        with self.batch_update():
+            for row_index, mark in self._pending_checkbox.items():
+                image_table.update_cell_at(Coordinate(row_index, 0), mark)
+        self._pending_checkbox.clear()
         count = len(self.selected_images)
-        delete_button = self.query_one("#delete-selected")
-        delete_button.disabled = count == 0
-        delete_button.label = f"🗑️ Delete Selected ({count})"
-        
+        self._w_delete_button.disabled = count == 0
+        self._w_delete_button.label = f"🗑️ Delete Selected ({count})"
         self.update_selection_info()
 
     def delete_selected_images(self):
         """Delete selected images."""
-        status = self.query_one("#delete-status")
+        status = self._w_delete_status
         if not self.selected_images:
             status.update("[bold yellow]⚠️ No images selected.[/bold yellow]")
             return
 
         count = len(self.selected_images)
         status.update(f"🗑️ Deleting {count} images...")
-        
+        self._delete_worker([self._row_ids[row_index] for row_index in self.selected_images])
+
+    @work(thread=True, exclusive=True, group="delete")
+    def _delete_worker(self, image_ids):
+        """Remove the given images off the UI thread."""
         try:
-            client = docker.from_env()
+            client = self.docker_client()
             deleted_count = 0
             deleted_size = 0
-            
-            for image_id in list(self.selected_images):
+            failed_count = 0
+
+            def _remove(image_id):
+                size = self._size_cache.get(image_id, 0)
+                client.images.remove(image_id, force=True)
+                return image_id, size
+
+            # Each removal is a blocking round-trip to the daemon; overlap
+            # them on the app-wide pool
+            futures = [self._pool.submit(_remove, image_id) for image_id in image_ids]
+            for future in as_completed(futures):
                 try:
-                    img = client.images.get(image_id)
-                    size = img.attrs.get('Size', 0)
-                    client.images.remove(image_id, force=True)
-                    deleted_count += 1
+                    image_id, size = future.result()
+                    self._size_cache.pop(image_id, None)
                     deleted_size += size
-                except docker.errors.APIError as e:
-                    status.update(f"[bold red]❌ Error deleting image[/bold red]")
-                    break
-            
-            if deleted_count > 0:
-                status.update(f"[bold green]✅ Deleted {deleted_count} images ({format_size(deleted_size)})[/bold green]")
-                self.selected_images.clear()
-                self.run_scan()
-                self.update_dashboard()
-            
-        except docker.errors.DockerException as e:
-            status.update(f"[bold red]❌ Docker error[/bold red]")
+                    deleted_count += 1
+                except docker.errors.APIError:
+                    failed_count += 1
+
+            self.call_from_thread(self._apply_delete, deleted_count, deleted_size, failed_count)
+        except docker.errors.DockerException:
+            self._invalidate_client()
+            self.call_from_thread(self._w_delete_status.update, "[bold red]❌ Docker error[/bold red]")
+
+    def _apply_delete(self, deleted_count, deleted_size, failed_count):
+        """Report deletion results and rescan (UI thread only)."""
+        status = self._w_delete_status
+        if failed_count:
+            status.update(f"[bold red]❌ Failed to delete {failed_count} image(s)[/bold red]")
+        if deleted_count > 0:
+            status.update(f"[bold green]✅ Deleted {deleted_count} images ({format_size(deleted_size)})[/bold green]")
+            self.selected_images.clear()
+            self._selected_bytes = 0
+            self.run_scan()
+            self._mark_dirty()
 
     def delete_all_unused(self):
         """Delete all unused images."""
-        status = self.query_one("#delete-status")
-        status.update("🗑️ Deleting ALL unused images...")
-        
-        try:
-            daemon.cleanup_images(dry_run=False)
-            status.update("[bold green]✅ Cleanup completed![/bold green]")
-            self.run_scan()
-            self.update_dashboard()
-        except Exception as e:
-            status.update(f"[bold red]❌ Error: {str(e)[:40]}[/bold red]")
+        self._w_delete_status.update("🗑️ Deleting ALL unused images...")
+        self._cleanup_worker(dry_run=False)
 
     def view_backup(self):
         """View backup information."""
-        status = self.query_one("#delete-status")
-        cfg = config.load_config()
-        backup_file = cfg.get("backup_file", "/var/lib/docker-janitor/backup.json")
+        status = self._w_delete_status
+        backup_file = self._cfg.get("backup_file", "/var/lib/docker-janitor/backup.json")
         
         try:
-            with open(backup_file, 'r') as f:
-                backup_data = json.load(f)
-            
-            timestamp = backup_data.get("timestamp", "Unknown")
-            images = backup_data.get("images", [])
-            
-            if not images:
-                status.update("[bold yellow]📋 No backup data found.[/bold yellow]")
+            mtime = os.stat(backup_file).st_mtime_ns
+            if self._backup_cache is not None and self._backup_cache[0] == mtime:
+                _, count, total_size, timestamp = self._backup_cache
+                self._show_backup_summary(count, total_size, timestamp)
                 return
+            count = 0
+            total_size = 0
+            with open(backup_file, 'r') as f:
+                first_line = f.readline()
+                try:
+                    header = config.json_loads(first_line)
+                except ValueError:
+                    header = None
+                if isinstance(header, dict) and "images" not in header:
+                    # NDJSON backup: header line, then one image object per
+                    # line. Only the count and size total are displayed, so
+                    # aggregate while streaming instead of building a list.
+                    timestamp = header.get("timestamp", "Unknown")
+                    for line in f:
+                        if line.strip():
+                            count += 1
+                            total_size += config.json_loads(line).get("size", 0)
+                else:
+                    # Legacy single-document backup
+                    f.seek(0)
+                    backup_data = config.json_loads(f.read())
+                    timestamp = backup_data.get("timestamp", "Unknown")
+                    images = backup_data.get("images", [])
+                    count = len(images)
+                    total_size = sum(img.get("size", 0) for img in images)
             
-            total_size = sum(img.get("size", 0) for img in images)
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_str = dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                time_str = timestamp
-                
-            status.update(f"[bold green]📋 Last backup: {time_str} - {len(images)} images ({format_size(total_size)})[/bold green]")
+            self._backup_cache = (mtime, count, total_size, timestamp)
+            self._show_backup_summary(count, total_size, timestamp)
             
         except FileNotFoundError:
             status.update("[bold yellow]📋 No backup file found.[/bold yellow]")
         except Exception as e:
             status.update(f"[bold red]❌ Error reading backup[/bold red]")
 
+    def _show_backup_summary(self, count, total_size, timestamp):
+        """Render the backup summary line from aggregated values."""
+        status = self._w_delete_status
+        if not count:
+            status.update("[bold yellow]📋 No backup data found.[/bold yellow]")
+            return
+
+        try:
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            time_str = dt.strftime("%Y-%m-%d %H:%M")
+        except:
+            time_str = timestamp
+
+        status.update(f"[bold green]📋 Last backup: {time_str} - {count} images ({format_size(total_size)})[/bold green]")
+
 if __name__ == "__main__":
     app = DockerJanitorApp()
     app.run()
\ No newline at end of file